@@ -1,12 +1,16 @@
-import random
+import sys
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
+
+import numpy as np
+
+STATUSES = ("To Do", "In Progress", "Done")
 
 
 # -----------------------------
 # Data Model
 # -----------------------------
-@dataclass
+@dataclass(slots=True)
 class Task:
     id: int
     title: str
@@ -18,14 +22,15 @@ class Task:
 # Sprint Simulator
 # -----------------------------
 class SprintBoard:
-    def __init__(self, tasks: List[Task]):
+    def __init__(self, tasks: List[Task], seed: Optional[int] = None):
         self.tasks = tasks
+        self._rng = np.random.default_rng(seed)
 
     def simulate_progress(self):
         """Randomly move tasks across statuses"""
-        for task in self.tasks:
-            move = random.choice(["To Do", "In Progress", "Done"])
-            task.status = move
+        moves = self._rng.integers(0, len(STATUSES), size=len(self.tasks))
+        for task, move in zip(self.tasks, moves.tolist()):
+            task.status = STATUSES[move]
 
     def completion_percentage(self) -> float:
         total_points = sum(t.story_points for t in self.tasks)
@@ -54,14 +59,18 @@ class SprintBoard:
         else:
             return "🔴 Needs Attention"
 
-    def report(self):
-        print("\n📋 Sprint Report")
+    def format_report(self) -> str:
+        lines = ["\n📋 Sprint Report"]
         for t in self.tasks:
-            print(f"Task {t.id}: {t.title} | SP: {t.story_points} | {t.status}")
+            lines.append(f"Task {t.id}: {t.title} | SP: {t.story_points} | {t.status}")
 
         percent = self.completion_percentage()
-        print(f"\nCompletion: {percent:.2f}%")
-        print("Health:", self.sprint_health())
+        lines.append(f"\nCompletion: {percent:.2f}%")
+        lines.append(f"Health: {self.sprint_health()}")
+        return "\n".join(lines)
+
+    def report(self):
+        sys.stdout.write(self.format_report() + "\n")
 
 
 # -----------------------------
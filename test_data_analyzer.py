@@ -0,0 +1,167 @@
+import statistics
+
+import numpy as np
+import pytest
+
+import data_analyzer
+from data_analyzer import DataAnalyzer, DataPoint, DataProcessor
+
+numba_paths = [
+    False,
+    pytest.param(True, marks=pytest.mark.skipif(not data_analyzer.NUMBA_AVAILABLE, reason="numba not installed")),
+]
+
+
+def make_analyzer(values, **kwargs):
+    return DataAnalyzer([DataPoint(str(i), v) for i, v in enumerate(values)], **kwargs)
+
+
+@pytest.mark.parametrize("use_numba", numba_paths)
+@pytest.mark.parametrize("size", [12, 20_000])
+@pytest.mark.parametrize("offset", [0.0, 1e6, 1e9])
+def test_statistics_accurate_on_offset_data(monkeypatch, use_numba, size, offset):
+    monkeypatch.setattr(data_analyzer, "NUMBA_AVAILABLE", use_numba)
+    values = (np.random.default_rng(0).normal(size=size) + offset).tolist()
+    analyzer = make_analyzer(values, specialize=True)
+
+    stats = analyzer.get_statistics()
+
+    assert stats["mean"] == pytest.approx(statistics.fmean(values), rel=1e-14, abs=1e-14)
+    assert stats["stdev"] == pytest.approx(statistics.stdev(values), rel=1e-12)
+
+
+def test_weighted_moving_average_weighs_latest_value_most():
+    analyzer = make_analyzer([1.0, 2.0, 3.0, 10.0])
+    assert analyzer.weighted_moving_average(2) == pytest.approx([5 / 3, 8 / 3, 23 / 3])
+
+
+@pytest.mark.parametrize("stat, reduce", [
+    ("mean", statistics.fmean),
+    ("median", statistics.median),
+    ("std", statistics.stdev),
+    ("min", min),
+    ("max", max),
+])
+def test_rolling_statistic_matches_naive_loop(stat, reduce):
+    values = np.random.default_rng(1).normal(size=30).tolist()
+    window = 4
+    expected = [reduce(values[i:i + window]) for i in range(len(values) - window + 1)]
+    assert make_analyzer(values).rolling_statistic(window, stat) == pytest.approx(expected)
+
+
+def test_windows_is_a_view_of_consecutive_values():
+    windows = make_analyzer([1.0, 2.0, 3.0, 4.0]).windows(3)
+    assert windows.tolist() == [[1.0, 2.0, 3.0], [2.0, 3.0, 4.0]]
+
+
+@pytest.mark.parametrize("call", [
+    lambda a: a.moving_average(0),
+    lambda a: a.weighted_moving_average(0),
+    lambda a: a.windows(0),
+    lambda a: a.windows(4),
+    lambda a: a.rolling_statistic(4),
+    lambda a: a.rolling_statistic(1, "std"),
+    lambda a: a.rolling_statistic(2, "mode"),
+])
+def test_window_arguments_rejected_with_value_error(call):
+    with pytest.raises(ValueError):
+        call(make_analyzer([1.0, 2.0, 3.0]))
+
+
+def test_moving_averages_return_short_series_unchanged():
+    analyzer = make_analyzer([1.0, 2.0, 3.0])
+    assert analyzer.moving_average(5) == [1.0, 2.0, 3.0]
+    assert analyzer.weighted_moving_average(5) == [1.0, 2.0, 3.0]
+
+
+def test_data_is_built_once_and_rebuilt_by_invalidate():
+    analyzer = make_analyzer([1.0, 2.0, 3.0])
+    first = analyzer.data
+    assert analyzer.data is first
+    first[0].value = 9.0
+    assert analyzer.data[0].value == 9.0
+
+    analyzer.values[1] = 5.0
+    analyzer.invalidate()
+    assert [p.value for p in analyzer.data] == [1.0, 5.0, 3.0]
+
+
+def test_statistics_are_cached_until_invalidate():
+    analyzer = make_analyzer([1.0, 2.0, 3.0])
+    assert analyzer.get_statistics()["mean"] == 2.0
+
+    analyzer.values[0] = 10.0
+    assert analyzer.get_statistics()["mean"] == 2.0
+
+    analyzer.invalidate()
+    assert analyzer.get_statistics()["mean"] == 5.0
+
+
+def test_get_statistics_returns_a_copy():
+    analyzer = make_analyzer([1.0, 2.0, 3.0])
+    analyzer.get_statistics()["mean"] = -1
+    assert analyzer.get_statistics()["mean"] == 2.0
+
+
+def test_format_report_matches_printed_report(capsys):
+    analyzer = DataProcessor.from_dict({"a": 10, "b": 11, "c": 9, "d": 10, "e": 10, "f": 40})
+    report = analyzer.format_report()
+
+    assert "  Count: 6" in report
+    assert "  Change: 300.00% ↑ Up" in report
+    assert "  - f: 40" in report
+
+    analyzer.print_report()
+    assert capsys.readouterr().out == report + "\n"
+
+
+@pytest.mark.skipif(not data_analyzer.NUMBA_AVAILABLE, reason="numba not installed")
+@pytest.mark.parametrize("shape", [(3,), (100,), (8, 8)])
+def test_stats_kernel_rejects_wrong_length(shape):
+    kernel = data_analyzer.make_stats_kernel(64)
+    with pytest.raises(ValueError):
+        kernel(np.ones(shape))
+
+
+@pytest.mark.skipif(not data_analyzer.NUMBA_AVAILABLE, reason="numba not installed")
+def test_stats_kernel_matches_numpy():
+    values = np.random.default_rng(2).normal(size=16)
+    total, mean_val, std_val, mn, mx = data_analyzer.make_stats_kernel(16)(values)
+    assert (total, mean_val, std_val, mn, mx) == pytest.approx(
+        (values.sum(), values.mean(), values.std(ddof=1), values.min(), values.max())
+    )
+
+
+@pytest.mark.skipif(not data_analyzer.NUMBA_AVAILABLE, reason="numba not installed")
+def test_processor_constructors_pass_specialize_through():
+    data_analyzer._stats_kernels.pop(5, None)
+    DataProcessor.from_list(list("abcde"), [1, 2, 3, 4, 5], specialize=True).get_statistics()
+    assert 5 in data_analyzer._stats_kernels
+
+    data_analyzer._stats_kernels.pop(6, None)
+    DataProcessor.from_dict({c: i for i, c in enumerate("abcdef")}, specialize=True).get_statistics()
+    assert 6 in data_analyzer._stats_kernels
+    data_analyzer._stats_kernels.pop(7, None)
+    DataProcessor.from_dict({c: i for i, c in enumerate("abcdefg")}).get_statistics()
+    assert 7 not in data_analyzer._stats_kernels
+
+
+def test_float32_points_keep_their_input_values():
+    values = [0.1, 5.3, 0.2, 0.1, 0.3, 0.2, 0.1, 0.2]
+    analyzer = make_analyzer(values, dtype=np.float32)
+
+    assert [p.value for p in analyzer.data] == values
+    assert [p.value for p in analyzer.filter_range(0.05, 0.15)] == [0.1, 0.1, 0.1]
+    assert [p.value for p in analyzer.find_outliers()] == [5.3]
+    assert "  - 1: 5.3\n" in analyzer.format_report()
+
+
+@pytest.mark.parametrize("dtype", [np.float32, "float32", np.float64, "f8"])
+def test_float_dtypes_accepted(dtype):
+    assert make_analyzer([1.5], dtype=dtype).values.dtype == np.dtype(dtype)
+
+
+@pytest.mark.parametrize("dtype", [np.int32, "int64", np.float16, object])
+def test_other_dtypes_rejected(dtype):
+    with pytest.raises(ValueError):
+        make_analyzer([1.5], dtype=dtype)
@@ -0,0 +1,29 @@
+from sprint import STATUSES, SprintBoard, Task
+
+
+def make_tasks(n=20):
+    return [Task(i, f"Task {i}", i % 5 + 1) for i in range(n)]
+
+
+def simulated_statuses(seed):
+    board = SprintBoard(make_tasks(), seed=seed)
+    board.simulate_progress()
+    return [t.status for t in board.tasks]
+
+
+def test_simulate_progress_is_reproducible_with_a_seed():
+    assert simulated_statuses(7) == simulated_statuses(7)
+    assert simulated_statuses(7) != simulated_statuses(8)
+
+
+def test_simulate_progress_only_uses_known_statuses():
+    assert set(simulated_statuses(1)) <= set(STATUSES)
+
+
+def test_completion_counts_direct_edits_and_appended_tasks():
+    board = SprintBoard([Task(1, "a", 5), Task(2, "b", 5)])
+    board.tasks[0].status = "Done"
+    assert board.completion_percentage() == 50.0
+
+    board.tasks.append(Task(3, "c", 10, "Done"))
+    assert board.completion_percentage() == 75.0
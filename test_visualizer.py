@@ -0,0 +1,61 @@
+import json
+
+import numpy as np
+import pytest
+
+import visualizer
+from visualizer import ChartGenerator, export_to_json
+
+
+def histogram_counts(values, bins):
+    """Map each printed bin label to its count"""
+    lines = ChartGenerator().histogram(values, bins).splitlines()[2:]
+    return {line.split(" | ")[0].strip(): int(line.rsplit("(", 1)[1].rstrip(")")) for line in lines}
+
+
+def test_histogram_value_on_edge_goes_to_the_bin_it_starts():
+    counts = histogram_counts([5.0, 5.6, 6.8], bins=3)
+    assert counts == {"5.0-   5.6": 1, "5.6-   6.2": 1, "6.2-   6.8": 1}
+
+
+def test_histogram_interior_edge_and_max_placement():
+    counts = histogram_counts([0.7, 3.4, 4.3, 9.7], bins=5)
+    assert list(counts.values()) == [1, 1, 1, 0, 1]
+
+
+def test_bar_chart_follows_width_changes():
+    viz = ChartGenerator(width=50)
+    viz.bar_chart({"a": 1.0})
+    viz.width = 80
+    rule, bar_line = viz.bar_chart({"a": 1.0, "b": 0.5}, "T").splitlines()[2:4]
+    assert rule == "=" * 80
+    assert bar_line.count("█") == 80
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(visualizer, "orjson", None)
+    return request.param
+
+
+def test_export_to_json_accepts_the_same_inputs_on_every_backend(json_backend, tmp_path):
+    path = tmp_path / "out.json"
+    data = {
+        "f32": np.float32(0.1),
+        "i64": np.int64(3),
+        "arr": np.arange(3),
+        "big": 2**70,
+        1: "int key",
+    }
+
+    export_to_json(data, str(path))
+
+    assert json.loads(path.read_text()) == {"f32": 0.1, "i64": 3, "arr": [0, 1, 2], "big": 2**70, "1": "int key"}
+
+
+def test_export_to_json_rejects_unserializable_values_on_every_backend(json_backend, tmp_path):
+    with pytest.raises(TypeError):
+        export_to_json({"x": object()}, str(tmp_path / "out.json"))
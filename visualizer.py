@@ -3,9 +3,42 @@ MacroHard Visualizer
 Generates charts and visual representations of data
 """
 
+from itertools import zip_longest
 from typing import List, Dict
 import json
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+
+def _json_default(obj):
+    """Encode NumPy values for the stdlib encoder the way orjson does"""
+    if isinstance(obj, np.floating):
+        # str() gives the shortest repr for the value's own precision (0.1, not 0.10000000149...)
+        return float(str(obj))
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(data: Dict) -> bytes:
+    """Encode data as indented JSON bytes"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            )
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits; the stdlib encoder decides what is valid
+            pass
+    return json.dumps(data, indent=2, default=_json_default).encode()
+
 
 class ChartGenerator:
     """Generate ASCII charts for terminal display"""
@@ -13,23 +46,35 @@ class ChartGenerator:
     def __init__(self, width: int = 50, height: int = 10):
         self.width = width
         self.height = height
+        # Full-length bars; each row slices the prefix it needs
+        self._bar_buf = "█" * width
+        self._hist_buf = "▓" * 30
+    
+    def _full_bar(self) -> str:
+        """Full-width bar, rebuilt if width was changed after construction"""
+        if len(self._bar_buf) != self.width:
+            self._bar_buf = "█" * self.width
+        return self._bar_buf
     
     def bar_chart(self, data: Dict[str, float], title: str = "") -> str:
         """Create a horizontal bar chart"""
         if not data:
             return "No data to display"
         
-        max_value = max(data.values()) if data else 1
+        vals = np.fromiter(data.values(), dtype=np.float64, count=len(data))
+        max_value = vals.max()
+        ratios = vals / max_value if max_value else np.zeros_like(vals)
+        # Clamped so slicing the full-width bar below can't wrap around
+        bar_lengths = np.clip(ratios * self.width, 0, self.width).astype(np.int32)
+        full_bar = self._full_bar()
         chart_lines = []
         
         if title:
             chart_lines.append(f"\n{title}")
             chart_lines.append("=" * self.width)
         
-        for label, value in data.items():
-            bar_length = int((value / max_value) * self.width)
-            bar = "█" * bar_length
-            chart_lines.append(f"{label:>15} | {bar} {value:.2f}")
+        for label, value, bar_length in zip(data.keys(), vals.tolist(), bar_lengths.tolist()):
+            chart_lines.append(f"{label:>15} | {full_bar[:bar_length]} {value:.2f}")
         
         return "\n".join(chart_lines)
     
@@ -38,22 +83,19 @@ class ChartGenerator:
         if not values:
             return "No data to display"
         
-        min_val = min(values)
-        max_val = max(values)
+        vals = np.asarray(values, dtype=np.float64)
+        min_val = float(vals.min())
+        max_val = float(vals.max())
         value_range = max_val - min_val if max_val != min_val else 1
         
         graph = []
         graph.append(f"\nMax: {max_val:.2f}")
         
-        for row in range(self.height, 0, -1):
-            line = "|"
-            for i, val in enumerate(values):
-                normalized = (val - min_val) / value_range
-                if normalized * self.height >= row - 1:
-                    line += "●"
-                else:
-                    line += " "
-            graph.append(line)
+        # Whole canvas in one broadcast: grid[r, i] is set when column i reaches row r
+        normalized = (vals - min_val) / value_range * self.height
+        rows = np.arange(self.height, 0, -1)[:, None]
+        grid = np.where(normalized[None, :] >= rows - 1, "●", " ")
+        graph.extend("|" + "".join(line) for line in grid.tolist())
         
         graph.append("+" + "-" * len(values))
         graph.append(f"Min: {min_val:.2f}")
@@ -68,34 +110,26 @@ class ChartGenerator:
         if not values:
             return "No data to display"
         
-        min_val = min(values)
-        max_val = max(values)
-        bin_width = (max_val - min_val) / bins
-        
-        # Count values in each bin
-        bin_counts = [0] * bins
-        for val in values:
-            bin_index = min(int((val - min_val) / bin_width), bins - 1)
-            bin_counts[bin_index] += 1
+        values_arr = np.asarray(values, dtype=np.float64)
+        bin_counts, edges = np.histogram(values_arr, bins=bins)
         
         # Create histogram
-        max_count = max(bin_counts) if bin_counts else 1
+        max_count = bin_counts.max() or 1
+        bar_lengths = bin_counts * 30 // max_count
         chart_lines = ["\nDistribution:"]
         
-        for i, count in enumerate(bin_counts):
-            bin_start = min_val + i * bin_width
-            bin_end = bin_start + bin_width
-            bar_length = int((count / max_count) * 30)
-            bar = "▓" * bar_length
-            chart_lines.append(f"{bin_start:6.1f}-{bin_end:6.1f} | {bar} ({count})")
+        for bin_start, bin_end, count, bar_length in zip(
+            edges[:-1].tolist(), edges[1:].tolist(), bin_counts.tolist(), bar_lengths.tolist()
+        ):
+            chart_lines.append(f"{bin_start:6.1f}-{bin_end:6.1f} | {self._hist_buf[:bar_length]} ({count})")
         
         return "\n".join(chart_lines)
 
 
 def export_to_json(data: Dict, filename: str = "output.json") -> None:
     """Export data to JSON file"""
-    with open(filename, 'w') as f:
-        json.dump(data, f, indent=2)
+    with open(filename, 'wb') as f:
+        f.write(_dumps(data))
     print(f"Data exported to {filename}")
 
 
@@ -104,11 +138,11 @@ def format_table(headers: List[str], rows: List[List]) -> str:
     if not headers or not rows:
         return "No data to display"
     
-    # Calculate column widths
-    col_widths = [len(h) for h in headers]
-    for row in rows:
-        for i, cell in enumerate(row):
-            col_widths[i] = max(col_widths[i], len(str(cell)))
+    # Stringify once, then take per-column widths from the transposed rows
+    str_rows = [[str(cell) for cell in row] for row in rows]
+    cols = list(zip_longest(*str_rows, fillvalue=""))
+    cols += [()] * (len(headers) - len(cols))
+    col_widths = [max(len(h), max(map(len, col), default=0)) for h, col in zip(headers, cols)]
     
     # Create separator
     separator = "+" + "+".join("-" * (w + 2) for w in col_widths) + "+"
@@ -122,8 +156,8 @@ def format_table(headers: List[str], rows: List[List]) -> str:
     table_lines.append(separator)
     
     # Data rows
-    for row in rows:
-        data_row = "|" + "|".join(f" {str(cell):<{col_widths[i]}} " for i, cell in enumerate(row)) + "|"
+    for row in str_rows:
+        data_row = "|" + "|".join(f" {cell:<{col_widths[i]}} " for i, cell in enumerate(row)) + "|"
         table_lines.append(data_row)
     
     table_lines.append(separator)